@@ -9,6 +9,9 @@ from omniad.utils.deps import check_dependency
 
 __version__ = "0.1.0"
 
+# Resolved adapter classes by algorithm name; filled on first get_detector() call.
+_CLASS_CACHE: dict[str, type[BaseDetector]] = {}
+
 
 def _apply_presets(algo_name: str, kwargs: dict[str, Any]) -> dict[str, Any]:
     """
@@ -65,6 +68,10 @@ def get_detector(name: str, **kwargs: Any) -> BaseDetector:
 
     final_kwargs = _apply_presets(name, kwargs)
 
+    cached_class = _CLASS_CACHE.get(name)
+    if cached_class is not None:
+        return cached_class(**final_kwargs)
+
     entry = _REGISTRY[name]
 
     check_dependency(
@@ -93,4 +100,5 @@ def get_detector(name: str, **kwargs: Any) -> BaseDetector:
             "Check naming conventions."
         )
 
+    _CLASS_CACHE[name] = cast("type[BaseDetector]", model_class)
     return cast(BaseDetector, model_class(**final_kwargs))
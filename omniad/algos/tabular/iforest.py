@@ -1,13 +1,33 @@
 from __future__ import annotations
 
-from typing import Any, ClassVar
+from typing import Any, Callable, ClassVar, cast
 
-from sklearn.ensemble import IsolationForest
+import numpy as np
+import numpy.typing as npt
 
 from omniad.core.adapters.sklearn_adapter import BaseSklearnAdapter
 from omniad.core.mixins import FeatureImportanceMixin
 
 
+def _node_depths(tree_: Any) -> npt.NDArray[np.float64]:
+    """
+    Depth of every node of a fitted sklearn tree, counting the root as 1.
+
+    Walks the tree level by level, so it does not depend on node ordering.
+    """
+    depths = np.zeros(tree_.node_count, dtype=np.float64)
+    depths[0] = 1.0
+    left, right = tree_.children_left, tree_.children_right
+
+    frontier = np.array([0], dtype=np.intp)
+    while frontier.size:
+        parents = frontier[left[frontier] != -1]
+        children = np.concatenate([left[parents], right[parents]])
+        depths[children] = np.tile(depths[parents], 2) + 1.0
+        frontier = children
+    return depths
+
+
 class IsolationForestAdapter(BaseSklearnAdapter, FeatureImportanceMixin):
     """
     Wrapper for Scikit-learn Isolation Forest.
@@ -20,14 +40,22 @@ class IsolationForestAdapter(BaseSklearnAdapter, FeatureImportanceMixin):
         The amount of contamination of the data set.
     n_jobs : int, default=-1
         The number of jobs to run in parallel. -1 means using all processors.
+        Trees are built concurrently by sklearn (thread-based), and inputs
+        larger than ``_predict_chunk_size`` rows are scored in parallel
+        row chunks.
     random_state : int | None, default=None
         Controls the pseudo-randomness of the selection of the feature
         and split values.
     """
 
-    _backend_cls: ClassVar[type | None] = IsolationForest
+    # Resolved on first instantiation so importing this module stays cheap.
+    _backend_cls: ClassVar[type | None] = None
     _param_mapping: ClassVar[dict[str, str]] = {}
     _accepts_sparse: ClassVar[bool] = True
+    # Path-length tables are rebuilt from the backend on fit/load
+    _transient_attrs: ClassVar[frozenset[str]] = BaseSklearnAdapter._transient_attrs | {
+        "_path_tables"
+    }
 
     def __init__(
         self,
@@ -37,9 +65,16 @@ class IsolationForestAdapter(BaseSklearnAdapter, FeatureImportanceMixin):
         random_state: int | None = None,
         **kwargs: Any,
     ) -> None:
+        cls = type(self)
+        if cls._backend_cls is None:
+            from sklearn.ensemble import IsolationForest
+
+            cls._backend_cls = IsolationForest
+
         self.n_estimators = n_estimators
         self.n_jobs = n_jobs
         self.random_state = random_state
+        self._path_tables: list[tuple[npt.NDArray[Any], npt.NDArray[Any]]] = []
 
         super().__init__(
             contamination=contamination,
@@ -53,4 +88,76 @@ class IsolationForestAdapter(BaseSklearnAdapter, FeatureImportanceMixin):
     def get_validation_rules(cls) -> set[str]:
         rules = super().get_validation_rules()
         rules.discard("reject_sparse")
+        # sklearn trees split and traverse on float32 anyway, so scores are
+        # unchanged; casting once spares the backend its own conversion
+        rules.add("require_float32")
         return rules
+
+    def _bind_score_fn(self) -> Callable[[Any], Any]:
+        """
+        Use cached path-length tables when sklearn does not provide them.
+
+        scikit-learn >= 1.3 precomputes per-node depths and per-leaf
+        average path lengths at fit time (_decision_path_lengths), so its
+        own decision_function is used. Older versions recompute them on
+        every call via decision_path(); for those the tables are built
+        once here and scoring goes through _decision_function_cached().
+        """
+        if hasattr(self.backend_model, "_decision_path_lengths"):
+            return super()._bind_score_fn()
+
+        self._build_path_tables()
+        self._score_fn = self._decision_function_cached
+        return self._score_fn
+
+    def _build_path_tables(self) -> None:
+        """Precompute (node depth, leaf average path length) per tree."""
+        from sklearn.ensemble._iforest import _average_path_length
+
+        self._path_tables = [
+            (
+                _node_depths(tree.tree_),
+                _average_path_length(tree.tree_.n_node_samples),
+            )
+            for tree in self.backend_model.estimators_
+        ]
+
+    def _decision_function_cached(self, X: Any) -> npt.NDArray[Any]:
+        """
+        Equivalent of IsolationForest.decision_function on cached tables.
+
+        Each tree only needs apply() to find the leaves; path lengths are
+        table lookups instead of a per-call decision_path() traversal.
+        """
+        from sklearn.ensemble._iforest import _average_path_length
+        from sklearn.utils.validation import check_array
+
+        model = self.backend_model
+        X = check_array(X, accept_sparse="csr", dtype=np.float32)
+        # apply(check_input=False) below trusts the width, so check it here
+        # with the same error sklearn's own decision_function raises
+        if X.shape[1] != model.n_features_in_:
+            raise ValueError(
+                f"X has {X.shape[1]} features, but {type(model).__name__} "
+                f"is expecting {model.n_features_in_} features as input."
+            )
+        subsample_features = getattr(model, "_max_features", X.shape[1]) != X.shape[1]
+
+        depths = np.zeros(X.shape[0], dtype=np.float64)
+        for tree, features, (node_depths, leaf_path_lengths) in zip(
+            model.estimators_, model.estimators_features_, self._path_tables
+        ):
+            X_subset = X[:, features] if subsample_features else X
+            leaves = tree.apply(X_subset, check_input=False)
+            depths += node_depths[leaves] + leaf_path_lengths[leaves] - 1.0
+
+        denominator = len(model.estimators_) * _average_path_length(
+            np.array([model.max_samples_])
+        )
+        # For a single training sample, denominator and depth are 0.
+        scores = 2 ** (
+            -np.divide(
+                depths, denominator, out=np.ones_like(depths), where=denominator != 0
+            )
+        )
+        return cast("npt.NDArray[Any]", -scores - model.offset_)
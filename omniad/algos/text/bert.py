@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
 import numpy.typing as npt
 
@@ -65,6 +65,10 @@ class BertDetectorAdapter(BaseTransformersAdapter):
     ... )
     """
 
+    _transient_attrs: ClassVar[frozenset[str]] = (
+        BaseTransformersAdapter._transient_attrs | {"_detector"}
+    )
+
     def __init__(
         self,
         detector: str = "IsolationForest",
@@ -123,7 +127,9 @@ class BertDetectorAdapter(BaseTransformersAdapter):
 
     def _score_embeddings(self, embeddings: npt.NDArray[Any]) -> npt.NDArray[Any]:
         """Score embeddings. OmniAD detector handles convention."""
-        return cast(npt.NDArray[Any], self._detector.predict_score(embeddings))
+        return cast(
+            npt.NDArray[Any], self._detector._predict_score_validated(embeddings)
+        )
 
     # --- Serialization ---
 
@@ -2,7 +2,7 @@ from __future__ import annotations
 
 import logging
 import os
-from typing import Any, cast
+from typing import Any, ClassVar, cast
 
 import numpy.typing as npt
 from sklearn.feature_extraction.text import TfidfVectorizer
@@ -52,6 +52,12 @@ class TfidfDetectorAdapter(BaseDetector):
     ... )
     """
 
+    # Saved natively under backend/ by _save_backend(), so not pickled again
+    _transient_attrs: ClassVar[frozenset[str]] = BaseDetector._transient_attrs | {
+        "_detector",
+        "_vectorizer",
+    }
+
     def __init__(
         self,
         detector: str = "IsolationForest",
@@ -113,7 +119,7 @@ class TfidfDetectorAdapter(BaseDetector):
     def predict_score(self, X: Any) -> npt.NDArray[Any]:
         X = self._validate(X)
         vectors = self._vectorizer.transform(X)
-        return cast(npt.NDArray[Any], self._detector.predict_score(vectors))
+        return cast(npt.NDArray[Any], self._detector._predict_score_validated(vectors))
 
     def _save_backend(self, path: str) -> None:
         import joblib
@@ -1,8 +1,11 @@
 from __future__ import annotations
 
+import io
 import logging
 import os
-from typing import Any, ClassVar, cast
+import pickle
+import zipfile
+from typing import Any, Callable, ClassVar, cast
 
 import joblib
 import numpy as np
@@ -13,6 +16,13 @@ from omniad.core.exceptions import ConfigError
 
 logger = logging.getLogger(__name__)
 
+_MODEL_FILE = "model.joblib"
+
+
+# Fixed stdlib codec: the archive must load wherever omniad is installed,
+# whatever optional packages happen to be importable at save time
+_JOBLIB_COMPRESSION = ("zlib", 6)
+
 
 class BaseSklearnAdapter(BaseDetector):
     """
@@ -30,49 +40,60 @@ class BaseSklearnAdapter(BaseDetector):
     _backend_cls: ClassVar[type | None] = None
     _param_mapping: ClassVar[dict[str, str]] = {}
     _invert_score: ClassVar[bool] = True
+    # Bound to the backend model, so never pickled with the wrapper
+    _transient_attrs: ClassVar[frozenset[str]] = BaseDetector._transient_attrs | {
+        "_score_fn"
+    }
+    # Wrapper-level kwargs that are never forwarded to the backend
+    _non_backend_keys: ClassVar[frozenset[str]] = frozenset(
+        {"backend_options", "threshold_strategy"}
+    )
+    # Row-chunk size above which scoring is spread over n_jobs threads
+    _predict_chunk_size: ClassVar[int] = 100_000
 
     def __init__(self, contamination: float = 0.1, **kwargs: Any) -> None:
         super().__init__(contamination=contamination, **kwargs)
         self.backend_options = kwargs.get("backend_options", {})
         # Store extra kwargs for backend passthrough
         self.kwargs = kwargs
+        self._score_fn: Callable[[Any], Any] | None = None
 
     def _fit_backend(self, X: Any, y: Any | None = None) -> None:
         """
         Fits the sklearn backend model.
+
+        X is expected to be already validated by BaseDetector.fit().
         """
-        # 1. Validate Input
+        # 1. Check backend
         if self._backend_cls is None:
             raise ConfigError(
                 f"Adapter {self.__class__.__name__} must define '_backend_cls'."
             )
 
-        X = self._validate(X)
-
         # 2. Prepare Parameters
-        # Priority: backend_options > kwargs > mapped params > defaults
-        init_params = self.kwargs.copy()
-
-        # Remove special keys that shouldn't go to backend
-        init_params.pop("backend_options", None)
-        init_params.pop("threshold_strategy", None)
-
-        # Apply mapping: keys in self.__dict__ -> keys expected by backend
-        for local_name, backend_name in self._param_mapping.items():
-            if hasattr(self, local_name):
-                value = getattr(self, local_name)
-                init_params[backend_name] = value
-
-        # Explicit backend options override everything
-        init_params.update(self.backend_options)
+        # Priority: backend_options > mapped params > kwargs > defaults
+        # (later entries win, built in one pass without intermediate copies)
+        init_params = {
+            # kwargs minus special keys that shouldn't go to backend
+            **{k: v for k, v in self.kwargs.items() if k not in self._non_backend_keys},
+            # Apply mapping: keys in self.__dict__ -> keys expected by backend
+            **{
+                backend_name: getattr(self, local_name)
+                for local_name, backend_name in self._param_mapping.items()
+                if hasattr(self, local_name)
+            },
+            # Explicit backend options override everything
+            **self.backend_options,
+        }
 
         logger.debug("Params: %s", init_params)
 
         # 3. Initialize & Fit
         self._backend_model = self._backend_cls(**init_params)
         self._backend_model.fit(X, y)
+        self._bind_score_fn()
 
-        self._cached_train_scores = self.predict_score(X)
+        self._cached_train_scores = self._predict_score_validated(X)
 
         logger.debug("Backend fitted: %s", self._backend_cls.__name__)
 
@@ -80,43 +101,118 @@ class BaseSklearnAdapter(BaseDetector):
         """
         Predict anomaly scores using the backend model.
 
-        Attempts to use 'score_samples' first, then 'decision_function'.
+        Attempts to use 'decision_function' first, then 'score_samples'.
         Inverts scores if '_invert_score' is True.
         """
-        X = self._validate(X)
+        return self._predict_score_validated(self._validate(X))
 
-        n = X.shape[0] if hasattr(X, "shape") else len(X)
-        logger.debug("predict_score: n_samples=%d", n)
+    def _bind_score_fn(self) -> Callable[[Any], Any]:
+        """
+        Resolve and cache the backend scoring method.
 
+        The backend class is fixed once fitted or loaded, so the lookup
+        runs once instead of on every predict_score() call.
+        """
         # Try standard sklearn methods
-        scores: Any
-        if hasattr(self.backend_model, "decision_function"):
-            scores = self.backend_model.decision_function(X)
-        elif hasattr(self.backend_model, "score_samples"):
-            scores = self.backend_model.score_samples(X)
-        else:
+        score_fn = getattr(self.backend_model, "decision_function", None)
+        if score_fn is None:
+            score_fn = getattr(self.backend_model, "score_samples", None)
+        if score_fn is None:
             raise ConfigError(
                 f"Backend {type(self.backend_model)} has neither "
                 "'score_samples' nor 'decision_function'."
             )
 
-        scores_arr = cast("npt.NDArray[Any]", np.asarray(scores))
+        self._score_fn = cast("Callable[[Any], Any]", score_fn)
+        return self._score_fn
+
+    def _predict_score_validated(self, X: Any) -> npt.NDArray[Any]:
+        """
+        Score already validated input with the backend model.
+
+        Shared by predict_score() and _fit_backend(), so training data
+        is validated and scored only once during fit().
+        """
+        n = X.shape[0] if hasattr(X, "shape") else len(X)
+        logger.debug("predict_score: n_samples=%d", n)
+
+        score_fn = self._score_fn
+        if score_fn is None:
+            score_fn = self._bind_score_fn()
+
+        scores: Any
+        chunk = self._predict_chunk_size
+        # Effective backend setting: backend_options may override the wrapper's
+        n_jobs = getattr(self._backend_model, "n_jobs", None)
+        if n > chunk and n_jobs not in (None, 1):
+            # Rows are scored independently, so chunks can run concurrently.
+            # Threads share the fitted model instead of pickling it per worker;
+            # tree traversal releases the GIL.
+            logger.debug("predict_score: chunk_size=%d, n_jobs=%s", chunk, n_jobs)
+            parts = joblib.Parallel(n_jobs=n_jobs, prefer="threads")(
+                joblib.delayed(score_fn)(X[i : i + chunk]) for i in range(0, n, chunk)
+            )
+            scores = np.concatenate(parts)
+        else:
+            scores = score_fn(X)
+
+        # sklearn scorers already return ndarrays; convert anything else
+        scores_arr: npt.NDArray[Any] = (
+            scores if isinstance(scores, np.ndarray) else np.asarray(scores)
+        )
 
         # Handle inversion (1 is anomaly)
         if self._invert_score:
-            scores_arr = -scores_arr
+            # Negate in place when the buffer is ours; never mutate a view
+            # the backend may still reference.
+            if scores_arr.flags.owndata and scores_arr.dtype.kind == "f":
+                np.negative(scores_arr, out=scores_arr)
+            else:
+                scores_arr = -scores_arr
 
         return scores_arr
 
     def _save_backend(self, path: str) -> None:
-        """Save sklearn model using joblib."""
-        model_path = os.path.join(path, "model.joblib")
-        joblib.dump(self.backend_model, model_path)
+        """Save sklearn model using compressed joblib."""
+        model_path = os.path.join(path, _MODEL_FILE)
+        joblib.dump(
+            self.backend_model,
+            model_path,
+            compress=_JOBLIB_COMPRESSION,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+
+    def _save_backend_zip(self, zf: zipfile.ZipFile, prefix: str) -> None:
+        """Dump sklearn model straight into the archive, no temp directory."""
+        buffer = io.BytesIO()
+        joblib.dump(
+            self.backend_model,
+            buffer,
+            compress=_JOBLIB_COMPRESSION,
+            protocol=pickle.HIGHEST_PROTOCOL,
+        )
+        # Already zlib-compressed by joblib: store it rather than deflate again
+        zf.writestr(
+            prefix + _MODEL_FILE, buffer.getvalue(), compress_type=zipfile.ZIP_STORED
+        )
+
+    def _load_backend_zip(self, zf: zipfile.ZipFile, prefix: str) -> None:
+        """Load sklearn model straight from the archive, no extraction."""
+        model_name = prefix + _MODEL_FILE
+        try:
+            f = zf.open(model_name)
+        except KeyError as e:
+            raise FileNotFoundError(f"Backend model not found at {model_name}") from e
+
+        with f:
+            self._backend_model = joblib.load(f)
+        self._bind_score_fn()
 
     def _load_backend(self, path: str) -> None:
         """Load sklearn model using joblib."""
-        model_path = os.path.join(path, "model.joblib")
-        if not os.path.exists(model_path):
-            raise FileNotFoundError(f"Backend model not found at {model_path}")
-
-        self._backend_model = joblib.load(model_path)
+        model_path = os.path.join(path, _MODEL_FILE)
+        try:
+            self._backend_model = joblib.load(model_path)
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"Backend model not found at {model_path}") from e
+        self._bind_score_fn()
@@ -54,6 +54,10 @@ class BaseTorchAdapter(BaseDetector):
     """
 
     _accepted_dims: ClassVar[tuple[int, ...] | None] = (2, 3)
+    # 'model' is the backend module itself; _load_backend() rebuilds it
+    _transient_attrs: ClassVar[frozenset[str]] = BaseDetector._transient_attrs | {
+        "model"
+    }
 
     def __init__(
         self,
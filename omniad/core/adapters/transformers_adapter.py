@@ -17,7 +17,7 @@ import json
 import logging
 import os
 from abc import abstractmethod
-from typing import Any, Callable, cast
+from typing import Any, Callable, ClassVar, cast
 
 import numpy as np
 import numpy.typing as npt
@@ -81,6 +81,14 @@ class BaseTransformersAdapter(BaseDetector):
         If True, save full model weights (state_dict) in addition to config.
     """
 
+    # Transformer objects are re-created by _load_backend() from the saved
+    # config (and weights, if save_weights=True), never pickled
+    _transient_attrs: ClassVar[frozenset[str]] = BaseDetector._transient_attrs | {
+        "_tokenizer",
+        "_transformer",
+        "_torch_device",
+    }
+
     def __init__(
         self,
         model_name: str = "bert-base-uncased",
@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import contextlib
+import io
 import json
 import logging
 import os
-import shutil
 import tempfile
+import uuid
+import zipfile
 from abc import ABC, abstractmethod
-from typing import Any, Callable
+from typing import Any, Callable, ClassVar
 
 import joblib
 import numpy as np
@@ -21,6 +24,11 @@ from omniad.utils.validation import validate_input
 
 logger = logging.getLogger(__name__)
 
+# Archive layout, shared by save() and load()
+_METADATA_FILE = "metadata.json"
+_ATTRIBUTES_FILE = "attributes.pkl"
+_BACKEND_PREFIX = "backend/"
+
 
 class BaseDetector(ABC):
     """
@@ -34,6 +42,10 @@ class BaseDetector(ABC):
         on the scores.
     """
 
+    # Attributes excluded from attributes.pkl because the backend files
+    # already hold them; _load_backend() must restore every one of them
+    _transient_attrs: ClassVar[frozenset[str]] = frozenset({"_backend_model"})
+
     def __init__(
         self,
         contamination: float = 0.1,
@@ -110,6 +122,8 @@ class BaseDetector(ABC):
     def _fit_backend(self, X: Any, y: Any | None = None) -> None:
         """
         Actual implementation of the fitting process for the backend model.
+
+        X has already been passed through _validate() by fit().
         """
         pass
 
@@ -118,6 +132,9 @@ class BaseDetector(ABC):
         """
         Predict the anomaly score of X of the input samples.
 
+        This is the validating public entry point: X is passed through
+        _validate() before scoring.
+
         Parameters
         ----------
         X : Any
@@ -131,7 +148,18 @@ class BaseDetector(ABC):
         """
         pass
 
-    def predict(self, X: Any, threshold: float | None = None) -> npt.NDArray[np.int_]:
+    def _predict_score_validated(self, X: Any) -> npt.NDArray[Any]:
+        """
+        Score input that has already been passed through _validate().
+
+        Used by pipelines that feed a nested detector with data they
+        produced themselves (TF-IDF vectors, embeddings), so it is not
+        validated twice. Adapters that can score validated data directly
+        override this; the default delegates to predict_score().
+        """
+        return self.predict_score(X)
+
+    def predict(self, X: Any, threshold: float | None = None) -> npt.NDArray[np.uint8]:
         """
         Predict if a particular sample is an outlier or not.
 
@@ -145,7 +173,7 @@ class BaseDetector(ABC):
 
         Returns
         -------
-        is_outlier : np.ndarray of shape (n_samples,)
+        is_outlier : np.ndarray of shape (n_samples,), dtype=uint8
             For each observation, tells whether or not
             it should be considered as an anomaly (1) or not (0).
 
@@ -168,7 +196,8 @@ class BaseDetector(ABC):
                 "Threshold not fitted. Run fit() or pass explicit threshold."
             )
 
-        return (scores > current_threshold).astype(np.int_)
+        # bool and uint8 share the same memory layout: reinterpret, no copy
+        return (scores > current_threshold).view(np.uint8)
 
     @property
     def backend_model(self) -> Any:
@@ -232,50 +261,65 @@ class BaseDetector(ABC):
         filepath : str
             Path where the model should be saved.
         """
-        filepath = str(filepath)
-        # Remove extension to allow shutil to add .zip correctly
-        base_name = os.path.splitext(filepath)[0]
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            # 1. Metadata (Class info, version, threshold)
-            meta = {
-                "class_name": self.__class__.__name__,
-                "contamination": self.contamination,
-                "threshold": self.threshold_,
-                "version": "0.1.0",
-            }
-            with open(os.path.join(tmp_dir, "metadata.json"), "w") as f:
-                json.dump(meta, f)
-
-            # 2. Backend (Native save)
-            backend_path = os.path.join(tmp_dir, "backend")
-            os.makedirs(backend_path)
-            with backend_boundary(self.__class__.__name__, phase="save"):
-                self._save_backend(backend_path)
-
-            # 3. Wrapper Attributes (Scalers, configs, etc.)
-            # We make a copy and remove the heavy backend model to avoid pickling it
-            state = self.__dict__.copy()
-            state.pop("_backend_model", None)
-
-            # If the model has a 'score_metric' attribute that is a function,
-            # convert it to string name for pickling.
-            metric = state.get("score_metric")
-            if callable(metric):
-                name = reverse_lookup_metric(metric)
-                if name is None:
-                    raise ConfigError(
-                        "Cannot save model with unregistered custom metric. "
-                        "Please register it:\n"
-                        "  from omniad.core.metrics import register_metric\n"
-                        "  register_metric('my_metric', func)"
-                    )
-                state["score_metric"] = name
-
-            joblib.dump(state, os.path.join(tmp_dir, "attributes.pkl"))
-
-            # 4. Pack into .zip
-            shutil.make_archive(base_name, "zip", tmp_dir)
+        filepath = os.fspath(filepath)
+        # Remove extension so that .zip is added exactly once
+        target = os.path.splitext(filepath)[0] + ".zip"
+
+        # Build the archive next to the target and swap it in only once it
+        # is complete, so a failed save never clobbers an existing model.
+        # open("xb") rather than mkstemp: keep the usual umask-based mode.
+        tmp_path = f"{target}.{uuid.uuid4().hex[:8]}.tmp"
+        try:
+            with open(tmp_path, "xb") as fh:
+                # Deflated by default; writers of already-compressed entries
+                # (the sklearn model dump) store them with ZIP_STORED
+                with zipfile.ZipFile(fh, "w", zipfile.ZIP_DEFLATED) as zf:
+                    self._write_archive(zf)
+            os.replace(tmp_path, target)
+        except BaseException:
+            with contextlib.suppress(OSError):
+                os.remove(tmp_path)
+            raise
+
+    def _write_archive(self, zf: zipfile.ZipFile) -> None:
+        """Write metadata, backend and wrapper attributes into zf."""
+        # 1. Metadata (Class info, version, threshold)
+        meta = {
+            "class_name": self.__class__.__name__,
+            "contamination": self.contamination,
+            "threshold": self.threshold_,
+            "version": "0.1.0",
+        }
+        zf.writestr(_METADATA_FILE, json.dumps(meta))
+
+        # 2. Backend (Native save)
+        with backend_boundary(self.__class__.__name__, phase="save"):
+            self._save_backend_zip(zf, _BACKEND_PREFIX)
+
+        # 3. Wrapper Attributes (Scalers, configs, etc.)
+        # Copy without the heavy backend model (and anything bound to it)
+        state = {
+            k: v for k, v in self.__dict__.items() if k not in self._transient_attrs
+        }
+
+        # If the model has a 'score_metric' attribute that is a function,
+        # convert it to string name for pickling.
+        metric = state.get("score_metric")
+        if callable(metric):
+            name = reverse_lookup_metric(metric)
+            if name is None:
+                raise ConfigError(
+                    "Cannot save model with unregistered custom metric. "
+                    "Please register it:\n"
+                    "  from omniad.core.metrics import register_metric\n"
+                    "  register_metric('my_metric', func)"
+                )
+            state["score_metric"] = name
+
+        buffer = io.BytesIO()
+        # Left uncompressed: the archive's deflate compresses it once
+        joblib.dump(state, buffer)
+        zf.writestr(_ATTRIBUTES_FILE, buffer.getvalue())
 
     def load(self, filepath: str) -> BaseDetector:
         """
@@ -291,23 +335,74 @@ class BaseDetector(ABC):
         self : object
             Loaded estimator.
         """
-        if not os.path.exists(filepath) and os.path.exists(filepath + ".zip"):
-            filepath += ".zip"
-
-        with tempfile.TemporaryDirectory() as tmp_dir:
-            shutil.unpack_archive(filepath, tmp_dir)
-
+        filepath = os.fspath(filepath)
+
+        # Open first, stat only on a miss: save() always appends ".zip",
+        # so also accept the path the user passed to save().
+        try:
+            archive = zipfile.ZipFile(filepath)
+        except FileNotFoundError:
+            if filepath.endswith(".zip") or not os.path.isfile(filepath + ".zip"):
+                raise
+            archive = zipfile.ZipFile(filepath + ".zip")
+
+        with archive as zf:
             # 1. Restore Attributes (Scalers, etc.)
-            attributes = joblib.load(os.path.join(tmp_dir, "attributes.pkl"))
+            with zf.open(_ATTRIBUTES_FILE) as f:
+                attributes = joblib.load(f)
             self.__dict__.update(attributes)
 
             # 2. Restore Backend
-            backend_path = os.path.join(tmp_dir, "backend")
             with backend_boundary(self.__class__.__name__, phase="load"):
-                self._load_backend(backend_path)
+                self._load_backend_zip(zf, _BACKEND_PREFIX)
+
+        self._is_fitted = True
+        return self
+
+    def _save_backend_zip(self, zf: zipfile.ZipFile, prefix: str) -> None:
+        """
+        Write the backend model into the archive under prefix.
+
+        The default runs _save_backend() in a temporary directory and
+        copies the resulting files into the archive. Adapters whose
+        backend can serialize to memory override this (together with
+        _load_backend_zip) to skip the temporary directory.
 
-            self._is_fitted = True
-            return self
+        Parameters
+        ----------
+        zf : zipfile.ZipFile
+            Archive opened for writing.
+        prefix : str
+            Archive directory for backend files, ending with "/".
+        """
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            self._save_backend(tmp_dir)
+            for root, _, files in os.walk(tmp_dir):
+                for name in files:
+                    full_path = os.path.join(root, name)
+                    rel_path = os.path.relpath(full_path, tmp_dir)
+                    zf.write(full_path, prefix + rel_path.replace(os.sep, "/"))
+
+    def _load_backend_zip(self, zf: zipfile.ZipFile, prefix: str) -> None:
+        """
+        Restore the backend model from the archive entries under prefix.
+
+        The default extracts those entries into a temporary directory
+        and calls _load_backend() on it.
+
+        Parameters
+        ----------
+        zf : zipfile.ZipFile
+            Archive opened for reading.
+        prefix : str
+            Archive directory for backend files, ending with "/".
+        """
+        members = [name for name in zf.namelist() if name.startswith(prefix)]
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            zf.extractall(tmp_dir, members)
+            backend_path = os.path.join(tmp_dir, prefix)
+            os.makedirs(backend_path, exist_ok=True)
+            self._load_backend(backend_path)
 
     @abstractmethod
     def _save_backend(self, path: str) -> None:
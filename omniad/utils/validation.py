@@ -17,13 +17,12 @@ Adding a new rule
 
 from __future__ import annotations
 
-import inspect
 import logging
+import sys
 from typing import Any, Callable, cast
 
 import numpy as np
 import numpy.typing as npt
-from sklearn.utils.validation import check_array
 
 from omniad.core.exceptions import DataFormatError
 
@@ -33,10 +32,27 @@ logger = logging.getLogger(__name__)
 #  --- Internal helpers (preserved from original) ---
 
 
+# Populated on the first pandas input, when pandas is already imported.
+_PANDAS_TYPES: tuple[type, ...] = ()
+
+
 def _is_pandas_object(X: Any) -> bool:
     """Check if X is a pandas DataFrame/Series without importing pandas."""
+    global _PANDAS_TYPES
+
+    if _PANDAS_TYPES and isinstance(X, _PANDAS_TYPES):
+        return True
+
+    # pandas >= 3 reports public classes as living in the top-level "pandas".
     module = getattr(type(X), "__module__", "")
-    return module.startswith("pandas.")
+    if module != "pandas" and not module.startswith("pandas."):
+        return False
+
+    if not _PANDAS_TYPES:
+        pd = sys.modules.get("pandas")
+        if pd is not None:
+            _PANDAS_TYPES = (pd.DataFrame, pd.Series)
+    return True
 
 
 def _to_numpy(X: Any) -> npt.NDArray[Any]:
@@ -59,6 +75,10 @@ def _to_numpy(X: Any) -> npt.NDArray[Any]:
     DataFormatError
         If conversion fails or pandas object cannot be converted.
     """
+    # Fast path: the overwhelmingly common input needs no conversion.
+    if isinstance(X, np.ndarray):
+        return X
+
     import scipy.sparse as sp
 
     if sp.issparse(X):
@@ -66,47 +86,19 @@ def _to_numpy(X: Any) -> npt.NDArray[Any]:
 
     if _is_pandas_object(X):
         if hasattr(X, "to_numpy"):
-            return cast("npt.NDArray[Any]", np.asarray(X.to_numpy()))
-        if hasattr(X, "values"):
-            return cast("npt.NDArray[Any]", np.asarray(X.values))
+            # to_numpy() already yields an ndarray for numpy-backed frames;
+            # only extension arrays need a further conversion.
+            arr = X.to_numpy(copy=False)
+            if isinstance(arr, np.ndarray):
+                return arr
+            return np.asarray(arr)
         raise DataFormatError(
             "Input looks like a pandas object but cannot be converted to numpy."
         )
 
-    if isinstance(X, np.ndarray):
-        return cast("npt.NDArray[Any]", X)
-
     return cast("npt.NDArray[Any]", np.asarray(X))
 
 
-def _check_array_compat(
-    X: npt.NDArray[Any],
-    accept_sparse: bool = False,
-    **kwargs: Any,
-) -> npt.NDArray[Any]:
-    """
-    Call sklearn check_array in a version-compatible way.
-
-    Handles the rename of force_all_finite → ensure_all_finite
-    in scikit-learn >= 1.6.
-    """
-    sig = inspect.signature(check_array)
-    params = sig.parameters
-
-    common_args: dict[str, Any] = {
-        "accept_sparse": accept_sparse,
-        "ensure_2d": True,
-        "dtype": None,  # preserve original dtype (float32/64)
-    }
-    common_args.update(kwargs)
-
-    if "ensure_all_finite" in params:
-        if "force_all_finite" in common_args:
-            common_args["ensure_all_finite"] = common_args.pop("force_all_finite")
-
-    return cast("npt.NDArray[Any]", check_array(X, **common_args))
-
-
 #  --- Rules ---
 
 
@@ -163,15 +155,14 @@ def _rule_reject_nan(X: Any) -> Any:
     """
     Raise if X contains NaN or Inf values.
 
-    Uses _check_array_compat to leverage sklearn's version-compatible
-    finite check. Skips the check for sparse matrices.
+    Skips the check for sparse matrices.
     """
     import scipy.sparse as sp
 
     if sp.issparse(X):
         return X
 
-    arr = np.asarray(X)
+    arr = X if isinstance(X, np.ndarray) else np.asarray(X)
     if not np.isfinite(arr).all():
         raise DataFormatError(
             "Input contains NaN or infinite values. "
@@ -181,9 +172,17 @@ def _rule_reject_nan(X: Any) -> Any:
 
 
 def _rule_require_float32(X: Any) -> npt.NDArray[Any]:
-    """Cast to float32 when needed."""
+    """
+    Cast to float32 when needed.
+
+    Dense arrays are also made C-contiguous (no copy if they already are),
+    so backends traverse rows without converting them again.
+    """
     try:
-        if isinstance(X, np.ndarray) and X.dtype == np.float32:
+        if isinstance(X, np.ndarray):
+            return np.ascontiguousarray(X, dtype=np.float32)
+
+        if X.dtype == np.float32:
             return cast("npt.NDArray[Any]", X)
 
         return cast("npt.NDArray[Any]", X.astype(np.float32))
@@ -1,10 +1,15 @@
+import zipfile
 from typing import Any
 
+import joblib
 import numpy as np
 import numpy.typing as npt
+import pytest
+import scipy.sparse as sp
 from sklearn.ensemble import IsolationForest as SklearnIF
 
 from omniad import get_detector
+from omniad.core.exceptions import ModelNotFittedError
 from omniad.core.mixins import FeatureImportanceMixin
 
 
@@ -128,3 +133,248 @@ def test_iforest_feature_importance_logic() -> None:
     assert (
         imp[0] > imp[1]
     ), f"Informative feature should have higher importance. Got {imp}"
+
+
+def test_iforest_fit_validates_once(
+    random_xy_dataset: tuple[Any, Any, Any], monkeypatch: Any
+) -> None:
+    """
+    E. Overhead Test.
+
+    Verifies that fit() validates the training data only once and reuses
+    the training scores for threshold calibration.
+    """
+    X_train, _, _ = random_xy_dataset
+
+    model = get_detector("IsolationForest", random_state=42, n_jobs=1)
+
+    calls = {"validate": 0, "predict_score": 0}
+    original_validate = model._validate
+    original_predict_score = model.predict_score
+
+    def counting_validate(X: Any) -> Any:
+        calls["validate"] += 1
+        return original_validate(X)
+
+    def counting_predict_score(X: Any) -> npt.NDArray[Any]:
+        calls["predict_score"] += 1
+        return original_predict_score(X)
+
+    monkeypatch.setattr(model, "_validate", counting_validate)
+    monkeypatch.setattr(model, "predict_score", counting_predict_score)
+
+    model.fit(X_train)
+
+    assert calls == {"validate": 1, "predict_score": 0}
+    assert model.threshold_ is not None
+
+
+def test_iforest_validates_to_float32(
+    random_xy_dataset: tuple[Any, Any, Any],
+) -> None:
+    """
+    E. Validation Test (dtype).
+
+    Verifies that dense input is validated to C-contiguous float32, the
+    layout sklearn trees traverse, while sparse input stays sparse.
+    """
+    X_train, _, _ = random_xy_dataset
+
+    model = get_detector("IsolationForest", random_state=42, n_jobs=1)
+    X_val = model._validate(np.asfortranarray(X_train, dtype=np.float64))
+
+    assert X_val.dtype == np.float32
+    assert X_val.flags.c_contiguous
+
+    X_sparse = model._validate(sp.csr_matrix(X_train))
+    assert sp.issparse(X_sparse)
+    assert X_sparse.dtype == np.float32
+
+
+def test_iforest_archive_layout(
+    random_xy_dataset: tuple[Any, Any, Any], tmp_path: Any
+) -> None:
+    """
+    F. Serialization Test.
+
+    Verifies that the already-compressed backend dump is stored as is,
+    not deflated a second time, and can be read back from the archive.
+    """
+    X_train, X_test, _ = random_xy_dataset
+
+    model = get_detector("IsolationForest", random_state=42, n_jobs=1)
+    model.fit(X_train)
+
+    save_path = tmp_path / "model.zip"
+    model.save(str(save_path))
+
+    with zipfile.ZipFile(save_path) as zf:
+        names = set(zf.namelist())
+        assert {"metadata.json", "attributes.pkl", "backend/model.joblib"} <= names
+        info = zf.getinfo("backend/model.joblib")
+        assert info.compress_type == zipfile.ZIP_STORED
+
+    loaded = get_detector("IsolationForest").load(str(save_path))
+    np.testing.assert_allclose(
+        loaded.predict_score(X_test), model.predict_score(X_test), rtol=1e-8
+    )
+
+
+def test_iforest_failed_save_keeps_archive(
+    random_xy_dataset: tuple[Any, Any, Any], tmp_path: Any
+) -> None:
+    """
+    F. Serialization Test.
+
+    Verifies that a save() that fails midway leaves an existing archive
+    untouched and no temporary file behind.
+    """
+    X_train, X_test, _ = random_xy_dataset
+
+    model = get_detector("IsolationForest", random_state=42, n_jobs=1)
+    model.fit(X_train)
+
+    save_path = tmp_path / "model.zip"
+    model.save(str(save_path))
+    original = save_path.read_bytes()
+
+    with pytest.raises(ModelNotFittedError):
+        get_detector("IsolationForest").save(str(save_path))
+
+    assert save_path.read_bytes() == original
+    assert [p.name for p in tmp_path.iterdir()] == ["model.zip"]
+
+    loaded = get_detector("IsolationForest").load(str(save_path))
+    np.testing.assert_allclose(
+        loaded.predict_score(X_test), model.predict_score(X_test), rtol=1e-8
+    )
+
+
+def test_iforest_chunked_scoring(
+    random_xy_dataset: tuple[Any, Any, Any], monkeypatch: Any
+) -> None:
+    """
+    G. Parity Test (chunked scoring).
+
+    Verifies that scoring large inputs in parallel row chunks gives the
+    same scores as a single backend call.
+    """
+    X_train, X_test, _ = random_xy_dataset
+
+    model = get_detector("IsolationForest", random_state=42, n_jobs=2)
+    model.fit(X_train)
+    expected = -model.backend_model.decision_function(X_test)
+
+    monkeypatch.setattr(model, "_predict_chunk_size", 7)
+    chunked = model.predict_score(X_test)
+
+    np.testing.assert_allclose(chunked, expected, rtol=1e-12)
+
+
+def test_iforest_chunked_scoring_respects_backend_options(
+    random_xy_dataset: tuple[Any, Any, Any], monkeypatch: Any
+) -> None:
+    """
+    G. Config Test (chunked scoring).
+
+    Verifies that chunk parallelism follows the effective backend n_jobs,
+    so backend_options={"n_jobs": 1} keeps scoring sequential.
+    """
+    X_train, X_test, _ = random_xy_dataset
+
+    model = get_detector(
+        "IsolationForest", random_state=42, n_jobs=-1, backend_options={"n_jobs": 1}
+    )
+    model.fit(X_train)
+    assert model.backend_model.n_jobs == 1
+
+    def fail_parallel(*args: Any, **kwargs: Any) -> Any:
+        raise AssertionError("scoring must not be parallelised")
+
+    monkeypatch.setattr(model, "_predict_chunk_size", 7)
+    monkeypatch.setattr(joblib, "Parallel", fail_parallel)
+
+    scores = model.predict_score(X_test)
+    np.testing.assert_allclose(
+        scores, -model.backend_model.decision_function(X_test), rtol=1e-12
+    )
+
+
+def test_iforest_score_fn_not_pickled(
+    random_xy_dataset: tuple[Any, Any, Any], tmp_path: Any
+) -> None:
+    """
+    H. Serialization Test (cached scoring method).
+
+    Verifies that the cached backend scoring method is rebound on load
+    and never pickled into the wrapper attributes.
+    """
+    X_train, X_test, _ = random_xy_dataset
+
+    model = get_detector("IsolationForest", random_state=42, n_jobs=1)
+    model.fit(X_train)
+    assert model._score_fn is not None  # type: ignore[attr-defined]
+
+    save_path = tmp_path / "model.zip"
+    model.save(str(save_path))
+
+    with zipfile.ZipFile(save_path) as zf, zf.open("attributes.pkl") as f:
+        attributes = joblib.load(f)
+    assert "_score_fn" not in attributes
+    assert "_backend_model" not in attributes
+
+    loaded = get_detector("IsolationForest").load(str(save_path))
+    assert loaded._score_fn.__self__ is loaded.backend_model  # type: ignore[attr-defined]
+    np.testing.assert_allclose(
+        loaded.predict_score(X_test), model.predict_score(X_test), rtol=1e-8
+    )
+
+
+@pytest.mark.parametrize("max_features", [1.0, 0.6])  # type: ignore[misc]
+@pytest.mark.parametrize("sparse", [False, True])  # type: ignore[misc]
+def test_iforest_cached_path_tables_parity(
+    random_xy_dataset: tuple[Any, Any, Any], max_features: float, sparse: bool
+) -> None:
+    """
+    I. Parity Test (cached path-length tables).
+
+    Verifies that scoring through the adapter's precomputed path-length
+    tables (used on scikit-learn < 1.3) equals sklearn's decision_function.
+    """
+    X_train, X_test, _ = random_xy_dataset
+    if sparse:
+        X_train, X_test = sp.csr_matrix(X_train), sp.csr_matrix(X_test)
+
+    model = get_detector(
+        "IsolationForest",
+        random_state=42,
+        n_jobs=1,
+        backend_options={"max_features": max_features},
+    )
+    model.fit(X_train)
+
+    model._build_path_tables()  # type: ignore[attr-defined]
+    cached = model._decision_function_cached(X_test)  # type: ignore[attr-defined]
+
+    np.testing.assert_allclose(
+        cached, model.backend_model.decision_function(X_test), rtol=1e-10
+    )
+
+
+def test_iforest_cached_path_tables_feature_check(
+    random_xy_dataset: tuple[Any, Any, Any],
+) -> None:
+    """
+    I. Validation Test (cached path-length tables).
+
+    Verifies that the cached scoring path rejects input of the wrong width
+    with the same ValueError as sklearn, instead of indexing out of bounds.
+    """
+    X_train, X_test, _ = random_xy_dataset
+
+    model = get_detector("IsolationForest", random_state=42, n_jobs=1)
+    model.fit(X_train)
+    model._build_path_tables()  # type: ignore[attr-defined]
+
+    with pytest.raises(ValueError, match="features, but IsolationForest"):
+        model._decision_function_cached(X_test[:, :2])  # type: ignore[attr-defined]
@@ -153,3 +153,38 @@ def test_tfidf_unknown_detector_raises() -> None:
 
     with pytest.raises(ConfigError):
         get_detector("TfidfDetector", detector="NonExistentDetector")
+
+
+# --- E. Serialization ---
+
+
+def test_tfidf_attributes_exclude_backend(
+    text_dataset: tuple[list[str], list[str], np.ndarray[Any, Any]],
+    tmp_path: Any,
+) -> None:
+    """
+    E. Serialization Test.
+
+    Verifies that the vectorizer and inner detector are stored only as
+    backend files, not pickled again into the wrapper attributes.
+    """
+    import zipfile
+
+    import joblib
+
+    train_texts, test_texts, _ = text_dataset
+
+    model = get_detector("TfidfDetector", random_state=42)
+    model.fit(train_texts)
+
+    save_path = tmp_path / "model.zip"
+    model.save(str(save_path))
+
+    with zipfile.ZipFile(save_path) as zf, zf.open("attributes.pkl") as f:
+        attributes = joblib.load(f)
+    assert not {"_backend_model", "_detector", "_vectorizer"} & attributes.keys()
+
+    loaded = get_detector("TfidfDetector").load(str(save_path))
+    np.testing.assert_allclose(
+        loaded.predict_score(test_texts), model.predict_score(test_texts), rtol=1e-8
+    )
@@ -29,3 +29,36 @@ def test_validation_rejects_bad_pandas() -> None:
 
     with pytest.raises(DataFormatError):
         validate_input(df, {"to_numpy", "require_2d", "reject_nan"})
+
+
+def test_validation_pandas_no_copy() -> None:
+    """Verify that a homogeneous DataFrame is converted without copying."""
+    df = pd.DataFrame(np.random.randn(10, 3))
+
+    X_out = validate_input(df, {"to_numpy", "require_2d", "reject_nan"})
+
+    assert isinstance(X_out, np.ndarray)
+    assert np.shares_memory(X_out, df.to_numpy())
+
+
+def test_is_pandas_object() -> None:
+    """Verify pandas detection for frames and series but not arrays or lists."""
+    from omniad.utils.validation import _is_pandas_object
+
+    assert _is_pandas_object(pd.DataFrame({"a": [1]}))
+    assert _is_pandas_object(pd.Series([1]))
+    assert not _is_pandas_object(np.zeros(3))
+    assert not _is_pandas_object([1, 2, 3])
+
+
+def test_validation_float32_contiguous() -> None:
+    """Verify require_float32 yields C-contiguous float32, copying only if needed."""
+    X = np.asfortranarray(np.random.randn(10, 3))
+
+    X_out = validate_input(X, {"to_numpy", "require_2d", "require_float32"})
+
+    assert X_out.dtype == np.float32
+    assert X_out.flags.c_contiguous
+
+    X_again = validate_input(X_out, {"to_numpy", "require_2d", "require_float32"})
+    assert X_again is X_out
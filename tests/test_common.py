@@ -50,6 +50,7 @@ def test_api_contract(
 
     labels = model.predict(X_test)
     assert labels.shape == (expected_len,)
+    assert labels.dtype == np.uint8
     assert set(np.unique(labels)).issubset({0, 1})
 
 
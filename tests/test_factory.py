@@ -7,3 +7,14 @@ from omniad.core.exceptions import ConfigError
 def test_factory_raises_unknown_algo() -> None:
     with pytest.raises(ConfigError, match="Unknown algorithm"):
         get_detector("SuperDuperAlgo")
+
+
+def test_factory_caches_resolved_class() -> None:
+    import omniad
+
+    first = get_detector("IsolationForest")
+    assert omniad._CLASS_CACHE["IsolationForest"] is type(first)
+
+    second = get_detector("IsolationForest", n_estimators=7)
+    assert type(second) is type(first)
+    assert second.n_estimators == 7  # type: ignore[attr-defined]